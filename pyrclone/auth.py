@@ -1,5 +1,5 @@
 from typing import List
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
 
 @dataclass(frozen=True)
@@ -13,12 +13,16 @@ class RCloneAuthenticator(ABC):
 
 @dataclass(frozen=True)
 class RCloneUserAuthenticator(RCloneAuthenticator):
+    _cl_arguments:List[str] = field(init=False, repr=False, compare=False)
 
+    def __post_init__(this):
+        # The object is frozen, so command line arguments can be computed once and for all
+        object.__setattr__(this, "_cl_arguments", [
+            "--rc-user", this.username,
+            "--rc-pass", this.passoword
+        ])
 
     @property
     def cl_arguments(this) -> List[str]:
-        return [
-            "--rc-user", this.username,
-            "--rc-pass", this.passoword
-        ]
+        return this._cl_arguments
 
@@ -1,9 +1,10 @@
 from __future__ import  annotations
-from typing import Union, Dict, Any, List, Iterable
+from typing import Union, Dict, List, Iterable, Tuple
 from enum import Enum
 from datetime import datetime
 from dataclasses import dataclass
-import re
+from functools import lru_cache
+import sys
 
 class RCJobStatus(Enum):
     NOT_STARTED:int = -1
@@ -11,31 +12,77 @@ class RCJobStatus(Enum):
     FINISHED:int = 1
     FAILED:int = 2
 
+# Job status indexed by (finished << 1) | success. None means that the job is either not started or in progress
+_STATUS_TABLE = (None, RCJobStatus.FINISHED, RCJobStatus.FAILED, RCJobStatus.FINISHED)
+
 def _fix_isotime(time: str) -> str:
     '''
     The ISO time returned by rclone (at least when tested on MEGA) returns a format that datetime doesn't like
-    This function fixes these issues
+    This function fixes these issues, so the timestamp is parsed as `datetime.fromisoformat` does since Python 3.11
 
     :param time: a string with a ISO timestamp
     :return: A string with a re-formatted timestamp
     '''
 
-    # Defines a regular expression to find the inconsistencies
-    pattern = r"[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}(\.[0-9]*)?(\+[0-9]{2}:[0-9]{2}|[a-zA-Z])?"
+    # Fractional seconds (if any), which start right after YYYY-MM-DDTHH:MM:SS, are truncated (or padded) to microseconds
+    i = time.find(".", 19)
+
+    if i != -1:
+        j = i + 1
+        while (j < len(time)) and time[j].isdigit():
+            j += 1
 
-    # Finds and match inconsistencies
-    matches = re.search(pattern, time)
+        fraction = time[i + 1:j][:6].ljust(6, "0") if j > i + 1 else ""
+        time = time[:i] + ("." + fraction if fraction else "") + time[j:]
 
-    # Fixes inconsistencies
-    if matches[1] is not None:
-        time = time.replace(matches[1], "")
-    if (matches[2] is not None) and (not matches[2].startswith("+")):
-        time = time.replace(matches[2], "")
+    # A trailing Z stands for UTC, while other trailing timezone letters are dropped. +HH:MM offsets are kept
+    if time[-1:] in ("Z", "z"):
+        time = time[:-1] + "+00:00"
+    elif time[-1:].isalpha():
+        time = time[:-1]
 
     # Returns a new string with fixed timestamp
     return time
 
-@dataclass
+# Jobs are polled over and over, and their timestamps do not change: parsed timestamps are thus memoized. The cache
+# holds the (up to two) timestamps of a few thousand jobs, so cyclic polling of many jobs doesn't keep evicting them
+_ISOTIME_CACHE_SIZE = 4096
+
+if sys.version_info >= (3, 11):
+    @lru_cache(maxsize=_ISOTIME_CACHE_SIZE)
+    def _parse_isotime(time: str) -> datetime:
+        '''
+        Parse an ISO timestamp returned by rclone. Since Python 3.11, `datetime.fromisoformat` accepts most of the
+        formats returned by rclone, hence `_fix_isotime` is used only when the native parser gives up
+
+        :param time: a string with a ISO timestamp
+        :return: A datetime object
+        '''
+        try:
+            return datetime.fromisoformat(time)
+        except ValueError:
+            return datetime.fromisoformat(_fix_isotime(time))
+else:
+    @lru_cache(maxsize=_ISOTIME_CACHE_SIZE)
+    def _parse_isotime(time: str) -> datetime:
+        '''
+        Parse an ISO timestamp returned by rclone
+
+        :param time: a string with a ISO timestamp
+        :return: A datetime object
+        '''
+        return datetime.fromisoformat(_fix_isotime(time))
+
+def _parse_end_isotime(time: Union[str | int]) -> Union[datetime | None]:
+    '''
+    Parse the end time of a job, which rclone sets to 0 while the job is still running
+
+    :param time: a string with a ISO timestamp, or 0
+    :return: A datetime object, None if the job has not ended yet
+    '''
+    return _parse_isotime(time) if time != 0 else None
+
+@dataclass(slots=True)
 class RCloneJob:
     '''
     This class contains information related to any job
@@ -53,31 +100,43 @@ class RCloneJob:
 
     @property
     def status(this) -> RCJobStatus:
-        if (not this.finished) and (not this.success):
+        status = _STATUS_TABLE[(this.finished << 1) | this.success]
+
+        if status is None:
+            # neither finished nor successful: it depends on whether the transfer has begun
             return RCJobStatus.IN_PROGRESS if this.stats is not None else RCJobStatus.NOT_STARTED
-        elif this.success:
-            return RCJobStatus.FINISHED
-        else:
-            return RCJobStatus.FAILED
 
-    @classmethod
-    def _get_data_from_json(cls, json_data:Dict) -> Dict[str|Any]:
-        return {
-        "id": json_data['id'],
-        "duration": json_data['duration'],
-        "startTime":  datetime.fromisoformat(_fix_isotime(json_data['startTime'])),
-        "endTime":  datetime.fromisoformat(_fix_isotime(json_data['endTime'])) if json_data['endTime'] != 0 else None,
-        "error":  json_data['error'],
-        "output":  json_data['output'],
-        "success":  json_data['success'],
-        "finished":  json_data['finished']
-        }
+        return status
+
+    # JSON keys of the fields following the timestamps, in the same order of the constructor parameters
+    _FIELD_SPEC = ('error', 'output', 'finished', 'success')
+
     @classmethod
     def from_json(cls, json_data:Dict) -> RCloneJob:
-        d = cls._get_data_from_json(json_data)
-        return cls(**d)
+        return cls(json_data['id'],
+                   json_data['duration'],
+                   _parse_isotime(json_data['startTime']),
+                   _parse_end_isotime(json_data['endTime']),
+                   *[json_data[k] for k in cls._FIELD_SPEC])
+
+    def update_from_json(this, json_data:Dict) -> RCloneJob:
+        '''
+        Update this object in place with a newer status of the same job
+
+        :param json_data: The job status returned by rclone
+        :return: This object
+        '''
+
+        this.duration = json_data['duration']
+        this.startTime = _parse_isotime(json_data['startTime'])
+        this.endTime = _parse_end_isotime(json_data['endTime'])
+
+        for k in this._FIELD_SPEC:
+            setattr(this, k, json_data[k])
 
-@dataclass(frozen=True)
+        return this
+
+@dataclass(frozen=True, slots=True)
 class RCloneJobStats:
     '''
     This class collects detailed information about a job that is transferring a file
@@ -93,20 +152,12 @@ class RCloneJobStats:
     def percentage(this)->float:
         return this.transferred_bytes/this.size
 
-    @classmethod
-    def from_json(cls, json_data:Dict) -> RCloneJobStats:
-        d = cls._get_data_from_json(json_data)
-        return cls(**d)
+    # JSON keys in the same order of the constructor parameters
+    _FIELD_SPEC = ('bytes', 'name', 'size', 'speed', 'speedAvg')
 
     @classmethod
-    def _get_data_from_json(cls, json_data: Dict) -> Dict[str | Any]:
-        return {
-            "transferred_bytes" : json_data['bytes'],
-            "filename" : json_data['name'],
-            "size" : json_data['size'],
-            "speed" : json_data['speed'],
-            "average_speed" : json_data['speedAvg'],
-        }
+    def from_json(cls, json_data:Dict) -> RCloneJobStats:
+        return cls(*[json_data[k] for k in cls._FIELD_SPEC])
 
 
 class RCloneTransferDetails:
@@ -114,8 +165,13 @@ class RCloneTransferDetails:
     This object collects the transfer information of many jobs, making easy to gather global information
     '''
 
+    __slots__ = ('_jobs', '_transferred_bytes', '_size', '_speed', '_average_speed')
+
     def __init__(this, jobs:List[RCloneJobStats]):
-        this._jobs=jobs
+        this._jobs=tuple(jobs)
+
+        # Job stats are immutable, so the global figures are computed only once
+        this._transferred_bytes, this._size, this._speed, this._average_speed = this._aggregate()
 
     def __len__(this) -> int:
         return len(this._jobs)
@@ -131,22 +187,34 @@ class RCloneTransferDetails:
     def __iter__(this) -> Iterable[RCloneJobStats]:
         return iter(this._jobs)
 
-    @property
-    def percentage(this) -> float:
+    def _aggregate(this) -> Tuple[int, int, float, float]:
+        '''
+        Collect in a single pass all the figures needed by the global properties
+
+        :return: transferred bytes, total size, total speed and total average speed
+        '''
 
         transf = 0
         total = 0
+        speed = 0.
+        average_speed = 0.
+
+        for job in this._jobs:
+            transf += job.transferred_bytes
+            total += job.size
+            speed += job.speed
+            average_speed += job.average_speed
 
-        for job in this:
-            transf+=job.transferred_bytes
-            total+=job.size
+        return transf, total, speed, average_speed
 
-        return transf/total
+    @property
+    def percentage(this) -> float:
+        return this._transferred_bytes/this._size if this._size > 0 else 0.
 
     @property
     def total_transfer_speed(this) -> float:
-        return sum([job.speed for job in this])
+        return this._speed
 
     @property
     def total_average_transfer_speed(this) -> float:
-        return sum([job.average_speed for job in this])
\ No newline at end of file
+        return this._average_speed
@@ -2,13 +2,175 @@ import asyncio
 
 from typing_extensions import Self, AsyncIterable
 from typing import Union, Tuple, Any, List, Dict
-from subprocess import Popen, PIPE
-from aiohttp import ClientSession, BasicAuth, ClientResponseError, ClientTimeout
-from aiohttp.client_exceptions import ClientConnectorError
+from subprocess import Popen, DEVNULL
+from aiohttp import ClientSession, BasicAuth, ClientResponseError, ClientTimeout, TCPConnector, DummyCookieJar, \
+    UnixConnector
+from aiohttp.client_exceptions import ClientConnectorError, ServerTimeoutError
 from .auth import RCloneAuthenticator
-from .jobs import RCloneJob, RCloneJobStats, RCJobStatus
-import json
+from .jobs import RCloneJob, RCloneJobStats, RCJobStatus, RCloneTransferDetails
 import os
+import posixpath
+import hashlib
+import re
+import time
+from functools import lru_cache
+from copy import deepcopy
+from yarl import URL
+
+# orjson is an optional (faster) drop-in replacement to encode requests and decode rclone responses
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+import json
+
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # orjson is stricter than json (eg, with integers wider than 64 bits): anything json accepts is still sent
+            return json.dumps(obj).encode("utf-8")
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+# ijson is an optional dependency to parse large listings incrementally
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Requests that can take long (eg, hashing or huge listings) only need the connection to be established in time
+_LONG_REQUEST_TIMEOUT = ClientTimeout(total=None, sock_connect=5)
+
+# Request bodies are encoded beforehand, hence their content type must be set explicitly
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Endpoints used while polling, built once. They are already encoded, so aiohttp doesn't need to validate them
+_EP_JOB_LIST = URL("/job/list", encoded=True)
+_EP_JOB_STATUS = URL("/job/status", encoded=True)
+_EP_CORE_STATS = URL("/core/stats", encoded=True)
+_EP_OPERATIONS_LIST = URL("/operations/list", encoded=True)
+_EP_OPERATIONS_STAT = URL("/operations/stat", encoded=True)
+
+# Endpoints requested via `make_request`, built on first use
+_ENDPOINTS: Dict[Tuple[str,str],URL] = dict()
+
+
+def _endpoint(backend: str, command: str) -> URL:
+    '''
+    Return the endpoint path of a backend command, building it only the first time it is requested
+
+    :param backend: RClone backend
+    :param command: Supported command within the backend
+    :return: The endpoint path, in the form /backend/command
+    '''
+
+    endpoint = _ENDPOINTS.get((backend, command))
+
+    if endpoint is None:
+        endpoint = _ENDPOINTS.setdefault((backend, command), URL(f"/{backend}/{command}", encoded=True))
+
+    return endpoint
+
+@lru_cache(maxsize=1024)
+def _normalise_path(path: str) -> str:
+    '''
+    rclone doesn't like paths starting with ./ or / (or both!). This function strips such prefixes, while leaving
+    untouched any other leading dot (eg, `..foo` or `.hidden`)
+
+    :param path: a path relative from root
+    :return: The normalised path
+    '''
+
+    while True:
+        if path.startswith("./"):
+            path = path[2:]
+        elif path.startswith("/"):
+            path = path.lstrip("/")
+        else:
+            break
+
+    return "" if path == "." else path
+
+# Matches paths on rclone remotes (eg, `remote:dir/file`), capturing remote name and path within the remote
+_REMOTE_PATH = re.compile(r"([^/\\:]+):(.*)")
+
+
+def _split_remote_path(path: str) -> Union[Tuple[str, str] | None]:
+    '''
+    Split a path to a file on an rclone remote into the directory containing the file and the file name
+
+    :param path: a path in the form `remote:path/to/file`
+    :return: A tuple (`remote:path/to`, `file`), None if the path is not on a remote or it is not a file path
+    '''
+
+    match = _REMOTE_PATH.fullmatch(path)
+
+    # On Windows, single letters followed by a colon are drive letters
+    if (match is None) or ((os.name == "nt") and (len(match[1]) == 1)):
+        return None
+
+    parent, name = posixpath.split(match[2])
+
+    if name == "":
+        return None
+
+    return f"{match[1]}:{parent}", name
+
+
+def _escape_glob(name: str) -> str:
+    '''
+    Escape the characters with a special meaning in rclone filter rules
+
+    :param name: a file name
+    :return: The escaped file name
+    '''
+
+    return re.sub(r"([\\*?\[\]{}])", r"\\\1", name)
+
+# Local files are hashed 1 MiB at a time
+_HASH_CHUNK_SIZE = 1 << 20
+
+
+def _hash_file(path: str, hasher: Any) -> str:
+    '''
+    Hash the content of a local file. This function is blocking
+
+    :param path: Path to the file
+    :param hasher: a hashlib object
+    :return: The hex digest of the file
+    '''
+
+    with open(path, "rb") as f:
+        while chunk := f.read(_HASH_CHUNK_SIZE):
+            hasher.update(chunk)
+
+    return hasher.hexdigest()
+
+# Job statuses that can no longer change
+_TERMINAL = frozenset({RCJobStatus.FINISHED, RCJobStatus.FAILED})
+
+# Maximum number of entries kept in each of the `ls`/`stat` caches
+_CACHE_MAXSIZE = 1024
+
+
+def _are_related_paths(a: str, b: str) -> bool:
+    '''
+    Check whether two paths (relative to the same root) are the same path, or one contains the other
+
+    :param a: a path relative from root
+    :param b: another path relative from the same root
+    :return: TRUE if the paths are related, FALSE otherwise
+    '''
+
+    return (a == b) or (a == "") or (b == "") or a.startswith(b + "/") or b.startswith(a + "/")
 
 
 class rclone:
@@ -18,7 +180,10 @@ class rclone:
                  address: str = "localhost",
                  port: int = 5572,
                  authentication: bool = False,
-                 authenticator: Union[RCloneAuthenticator | None] = None
+                 authenticator: Union[RCloneAuthenticator | None] = None,
+                 cache_ttl: float = 0.,
+                 pool_size: int = 100,
+                 socket_path: Union[str | None] = None
                  ):
         '''
         RClone remote controller class. It either uses an already running rclone deamon, or starts its own via the
@@ -33,11 +198,17 @@ class rclone:
         :param port: Port where the server (will) listen
         :param authentication: TRUE if authentication is used, otherwise FALSE
         :param authenticator: An RCloneAuthenticator object
+        :param cache_ttl: Number of seconds the results of `ls` (non recursive only) and `stat` are cached for. By
+                          default (0), caching is disabled
+        :param pool_size: Maximum number of concurrent connections to the daemon
+        :param socket_path: Path of a Unix domain socket to use in place of `address` and `port` (POSIX only). It
+                            avoids the overhead of the TCP stack when the daemon runs on the same machine
         '''
 
         this._cmd = cmd
         this._address = address
         this._port = port
+        this._socket_path = socket_path
         this._auth = None
 
         if authentication:
@@ -46,16 +217,30 @@ class rclone:
 
             this._auth = authenticator
 
-        this._running_server: Union[Popen | None] = None
+        # The authorization header never changes, hence it is encoded once and sent by default with every request
+        this._default_headers:Dict[str,str] = dict()
+
+        if this._auth is not None:
+            auth = BasicAuth(login=this._auth.username, password=this._auth.passoword)
+            this._default_headers['Authorization'] = auth.encode()
+
+        this._running_server: Union[Popen | asyncio.subprocess.Process | None] = None
         this._session: Union[ClientSession | None] = None
-        this._transferring_jobs:List[int] = []
+        this._transferring_jobs:set[int] = set()
         this._transferring_jobs_last_update:Dict[int,Union[RCloneJob|None]] = dict()
+        this._pending_jobs:set[int] = set()  # tracked jobs that are not known to be finished/failed yet
+        this._job_destinations:Dict[int,Tuple[str,str]] = dict()  # (root, path) written by each pending job
+        this._remotes:Union[List[Tuple[str,str]] | None] = None
+
+        this._pool_size = pool_size
+        this._cache_ttl = cache_ttl
+        this._stat_cache:Dict[Tuple[str,str],Tuple[float,Any]] = dict()
+        this._ls_cache:Dict[Tuple[str,str,bool],Tuple[float,Any]] = dict()
 
         # this._debug = open('debug.txt','w')
 
     async def __aenter__(this) -> Self:
-        this.run()
-        return this
+        return await this.start()
 
     async def __aexit__(this, exc_type, exc_val, exc_tb) -> bool:
         await this.quit()
@@ -68,11 +253,23 @@ class rclone:
         :return: A ClientSession object
         '''
         if this._session is None:
-            args = {"base_url": f"http://{this._address}:{this._port}", "timeout":ClientTimeout(total=10)}
+            # All the requests go to the same host: keep as many connections alive as possible and reuse them
+            if this._socket_path is not None:
+                # The host name is required to build the URLs, but it isn't used to route the requests
+                base_url = "http://localhost"
+                connector = UnixConnector(path=this._socket_path, limit=0, limit_per_host=this._pool_size,
+                                          keepalive_timeout=75)
+            else:
+                base_url = f"http://{this._address}:{this._port}"
+                connector = TCPConnector(limit=0, limit_per_host=this._pool_size, keepalive_timeout=75,
+                                         ttl_dns_cache=300)
 
-            if this._auth is not None:
-                auth = BasicAuth(login=this._auth.username, password=this._auth.passoword)
-                args['auth'] = auth
+            args = {"base_url": base_url,
+                    "timeout":ClientTimeout(total=10, sock_connect=5),
+                    "connector": connector,
+                    "cookie_jar": DummyCookieJar(),  # rclone doesn't use cookies
+                    "headers": this._default_headers,
+                    "skip_auto_headers": ("User-Agent",)}  # rclone doesn't care about the client
 
             this._session = ClientSession(**args)
 
@@ -89,17 +286,135 @@ class rclone:
         :param kwargs: Anything supported by backend/command
         :return: A dictionary representing the json response provided by RClone
         '''
-        # this._debug.write(f"\nMaking request {backend}/{command}\n")
+
+        return await this._request(_endpoint(backend, command), **kwargs)
+
+    async def _post(this,
+                    endpoint: URL,
+                    kwargs: Dict[str, Any],
+                    timeout: Union[ClientTimeout | None] = None) -> bytes:
+        '''
+        Send a request to the RClone Daemon
+
+        Raises ClientResponseError if rclone doesn't reply with a success status
+
+        :param endpoint: Endpoint path, in the form /backend/command
+        :param kwargs: Anything supported by the endpoint
+        :param timeout: Timeout of this request. If None, the session timeout is used
+        :return: The raw body of the response
+        '''
+        # this._debug.write(f"\nMaking request {endpoint}\n")
         # this._debug.write(f"Args {kwargs}\n")
 
-        async with this._http_session.post(f"/{backend}/{command}", ssl=False, json=kwargs) as response:
+        # The session is accessed directly once created, skipping the property
+        session = this._session if this._session is not None else this._http_session
+
+        # aiohttp reads an explicit None as "no timeout at all", hence it is passed only when provided
+        options = {"timeout": timeout} if timeout is not None else {}
 
-            content = await response.text(encoding="utf-8")
+        async with session.post(endpoint, data=_json_dumps(kwargs), headers=_JSON_HEADERS, **options) as response:
+
+            # The body is always read in full: a partially read response would close the connection rather than
+            # returning it to the pool
+            content = await response.read()
             if response.status == 200:
                 # this._debug.write(f"Response {content}\n")
-                return json.loads(content)
+                return content
             else:
-                raise ClientResponseError(response.request_info, response.history, message=content)
+                raise ClientResponseError(response.request_info,
+                                          response.history,
+                                          message=content.decode("utf-8", "replace"))
+
+    async def _request(this, endpoint: URL, timeout: Union[ClientTimeout | None] = None, /, **kwargs) -> Any:
+        '''
+        Make a request to the RClone Daemon to an already formatted endpoint
+        :param endpoint: Endpoint path, in the form /backend/command
+        :param timeout: Timeout of this request. If None, the session timeout is used
+        :param kwargs: Anything supported by the endpoint
+        :return: A dictionary representing the json response provided by RClone
+        '''
+
+        content = await this._post(endpoint, kwargs, timeout)
+        return _json_loads(content)  # both parsers read bytes directly, no need to decode the body first
+
+    async def _request_no_body(this, endpoint: URL, /, **kwargs) -> bool:
+        '''
+        Make a request to the RClone Daemon whose response is not needed, hence it is not parsed
+
+        Raises ClientResponseError for any issues related to client/server connection
+
+        :param endpoint: Endpoint path, in the form /backend/command
+        :param kwargs: Anything supported by the endpoint
+        :return: TRUE, as rclone replied with a success status
+        '''
+
+        await this._post(endpoint, kwargs)
+        return True
+
+    def _cache_get(this, cache: Dict, key: Tuple) -> Tuple[bool, Any]:
+        '''
+        Look up a cache entry that is not expired yet
+
+        :param cache: Either the `ls` or the `stat` cache
+        :param key: The entry key
+        :return: A tuple (TRUE, value) on cache hit, (FALSE, None) otherwise. The value is a copy of the cached one,
+                 which callers are free to modify
+        '''
+
+        entry = cache.get(key)
+
+        if entry is None:
+            return False, None
+
+        if (time.monotonic() - entry[0]) >= this._cache_ttl:
+            del cache[key]  # expired entries are dropped right away, rather than waiting to be evicted
+            return False, None
+
+        return True, deepcopy(entry[1])
+
+    def _cache_set(this, cache: Dict, key: Tuple, value: Any) -> Any:
+        '''
+        Store a cache entry, evicting the oldest one when the cache is full
+
+        :param cache: Either the `ls` or the `stat` cache
+        :param key: The entry key
+        :param value: The value to cache
+        :return: The value to return to the caller, which doesn't share anything with the cached one
+        '''
+
+        if this._cache_ttl <= 0:
+            return value
+
+        cache.pop(key, None)
+
+        if len(cache) >= _CACHE_MAXSIZE:
+            del cache[next(iter(cache))]  # dictionaries keep insertion order: the first entry is the oldest
+
+        cache[key] = (time.monotonic(), value)
+
+        return deepcopy(value)
+
+    def invalidate(this, root: str, path: Union[str | None] = None) -> Self:
+        '''
+        Drop the cached results of `ls` and `stat` that might be affected by changes to root/path, ie those about the
+        path itself, its ancestors and its descendants.
+
+        :param root: An RClone remote or a local path
+        :param path: a path relative from root. If None, all the entries related to root are dropped
+        :return: This object
+        '''
+
+        if path is not None:
+            path = _normalise_path(path)
+
+        for cache in (this._stat_cache, this._ls_cache):
+            stale = [k for k in cache
+                     if (k[0] == root) and ((path is None) or _are_related_paths(_normalise_path(k[1]), path))]
+
+            for k in stale:
+                del cache[k]
+
+        return this
 
     async def ls(this, root: str, path: str, recursive: bool = False) -> Any:
         '''
@@ -119,15 +434,25 @@ class rclone:
         if recursive:
             opt['recurse'] = True
 
-        path = path.lstrip("./")  # rclone doesn't like paths startign with . or / (or both!)
+        path = _normalise_path(path)
+
+        key = (root, path, recursive)
+        hit, listing = this._cache_get(this._ls_cache, key)
+
+        if hit:
+            return listing
 
         try:
-            data = await this.make_request("operations",
-                                           "list",
-                                           fs=root,
-                                           remote=path,
-                                           opt=opt)
-            return data['list']
+            data = await this._request(_EP_OPERATIONS_LIST,
+                                       fs=root,
+                                       remote=path,
+                                       opt=opt)
+
+            # Recursive listings can be huge, hence they are not kept in memory
+            if recursive:
+                return data['list']
+
+            return this._cache_set(this._ls_cache, key, data['list'])
 
         except ClientResponseError as err:
             if "directory not found" in err.message:
@@ -135,6 +460,48 @@ class rclone:
             else:
                 raise err
 
+    async def ls_stream(this, root: str, path: str, recursive: bool = True) -> AsyncIterable[Any]:
+        '''
+        Iterate over the files within root at the given Path. Differently than `ls`, if `ijson` is installed, the
+        listing is parsed while it is received, hence huge listings are never held in memory all at once
+
+        Raises `FileNotFoundError` if the root/path doesn't exist
+        Raises ClientResponseError for any issues related to client/server connection
+
+        :param root: An RClone remote or a local path
+        :param path: a path relative from root
+        :param recursive: If TRUE, runs a recursive listing of all files in root/path
+        :return: An asynchronous iterable over the content of the directory
+        '''
+
+        path = _normalise_path(path)
+        hit, listing = this._cache_get(this._ls_cache, (root, path, recursive))
+
+        if (ijson is None) or hit:
+            for item in (listing if hit else await this.ls(root, path, recursive)):
+                yield item
+
+            return
+
+        opt = {'recurse': True} if recursive else {}
+
+        # Huge listings can take a long time to be received: the default timeout doesn't apply
+        async with this._http_session.post(_EP_OPERATIONS_LIST,
+                                           data=_json_dumps({"fs": root, "remote": path, "opt": opt}),
+                                           headers=_JSON_HEADERS,
+                                           timeout=_LONG_REQUEST_TIMEOUT) as response:
+
+            if response.status != 200:
+                message = (await response.read()).decode("utf-8", "replace")
+
+                if "directory not found" in message:
+                    raise FileNotFoundError(f"{os.path.join(root, path)} was not found")
+
+                raise ClientResponseError(response.request_info, response.history, message=message)
+
+            async for item in ijson.items_async(response.content, "list.item", use_float=True):
+                yield item
+
     async def exists(this, root: str, path: str) -> bool:
         '''
         Check if the provided file/directory exists
@@ -155,34 +522,132 @@ class rclone:
         :return: A json containing information about the file/directory, None otherwise
         '''
 
-        data = await this.make_request("operations",
-                                       "stat",
-                                       fs=root,
-                                       remote=path)
-        return data['item']
+        key = (root, path)
+        hit, item = this._cache_get(this._stat_cache, key)
+
+        if hit:
+            return item
+
+        data = await this._request(_EP_OPERATIONS_STAT,
+                                   fs=root,
+                                   remote=path)
+
+        return this._cache_set(this._stat_cache, key, data['item'])
+
+    async def stat_batch(this, root: str, paths: List[str]) -> Dict[str, Any]:
+        '''
+        Give information about many files or directories at once. Requests are sent concurrently (the HTTP session
+        keeps a pool of connections), hence the whole batch takes about as long as the slowest request
+
+        :param root: An RClone remote or a local path
+        :param paths: a list of paths relative from root
+        :return: A dictionary mapping each path to the result of `stat`, or to the exception raised while fetching it
+        '''
 
-    async def list_remotes(this):
+        results = await asyncio.gather(*[this.stat(root, p) for p in paths], return_exceptions=True)
+
+        return dict(zip(paths, results))
+
+    async def exists_batch(this, root: str, paths: List[str]) -> Dict[str, bool]:
+        '''
+        Check if the provided files/directories exist. Requests are sent concurrently
+
+        :param root: An RClone remote or a local path
+        :param paths: a list of paths relative from root
+        :return: A dictionary mapping each path to TRUE if it exists, FALSE otherwise
+        '''
+
+        results = await asyncio.gather(*[this.stat(root, p) for p in paths])
+
+        return {p: r is not None for p, r in zip(paths, results)}
+
+    async def exists_many(this, root: str, paths: List[str]) -> Dict[str, bool]:
+        '''
+        Check if the provided files/directories exist. Rather than checking each path on its own, paths are grouped by
+        their parent directory, which is listed only once. Listings are requested concurrently
+
+        This pays off when many paths share few directories. Otherwise, `exists_batch` should be preferred, as whole
+        directories are listed (and cached, if caching is enabled). Names are matched case-sensitively, even on
+        case-insensitive backends
+
+        :param root: An RClone remote or a local path
+        :param paths: a list of paths relative from root
+        :return: A dictionary mapping each path to TRUE if it exists, FALSE otherwise
+        '''
+
+        by_parent:Dict[str,List[str]] = dict()
+        others:List[str] = []  # paths without a proper name (eg, the root) can't be looked up in the parent listing
+
+        for p in paths:
+            parent, name = posixpath.split(_normalise_path(p))
+
+            if name in ("", ".", ".."):
+                others.append(p)
+            else:
+                by_parent.setdefault(parent, []).append(p)
+
+        parents = list(by_parent)
+
+        listings, others_exist = await asyncio.gather(
+            asyncio.gather(*[this._list_names(root, d) for d in parents]),
+            asyncio.gather(*[this.exists(root, p) for p in others])
+        )
+
+        result = dict(zip(others, others_exist))
+
+        for parent, names in zip(parents, listings):
+            for p in by_parent[parent]:
+                result[p] = posixpath.basename(_normalise_path(p)) in names
+
+        return {p: result[p] for p in paths}
+
+    async def _list_names(this, root: str, path: str) -> set[str]:
+        '''
+        Return the names of the files and directories within root at the given path
+
+        :param root: An RClone remote or a local path
+        :param path: a path relative from root
+        :return: A set of names, empty if root/path doesn't exist
+        '''
+
+        try:
+            return {item['Name'] for item in await this.ls(root, path)}
+        except FileNotFoundError:
+            return set()
+
+    async def list_remotes(this) -> List[Tuple[str,str]]:
         '''
-        Return the list of remotes
+        Return the list of remotes. The rclone configuration is fetched only once, then the list is cached until
+        `invalidate_remotes` is called
 
         Raises ClientResponseError for any issues related to client/server connection
 
-        :return:
+        :return: A list of tuples (type, name) for each remote
         '''
 
-        d = await this.make_request('config', 'dump', long=True)
+        if this._remotes is None:
+            d = await this.make_request('config', 'dump', long=True)
+
+            this._remotes = [(v['type'], f"{k}:") for k, v in d.items()]
 
-        remotes = []
+        return list(this._remotes)
+
+    def invalidate_remotes(this) -> Self:
+        '''
+        Drop the cached list of remotes, so that the next call to `list_remotes` fetches the rclone configuration again
+
+        :return: This object
+        '''
 
-        for k in d:
-            remotes.append((d[k]['type'], f"{k}:"))
+        this._remotes = None
 
-        return remotes
+        return this
 
     async def checksum(this, path: str, hash: str = "md5", remote: bool = False) -> Union[str|None]:
         '''
-        Calculate the checksum of a file. This command doesn't use remote control as this command is only available
-        from the classic comamnd line. Why? Dunno!
+        Calculate the checksum of a file. Files on remotes are hashed by the rclone daemon (if this object launched it
+        or already talked to it), local files in-process, other files (and any file when the daemon is unreachable or
+        too old to support hashing, or when the hash is not available in Python) via the classic command line
 
         :param path: Path to the file to get its checksum
         :param hash: The list of supported hashes is here: https://rclone.org/commands/rclone_hashsum/
@@ -191,23 +656,84 @@ class rclone:
         :return:a string representing the hash of the file
         '''
 
+        remote_path = _split_remote_path(path)
+
+        # Without any sign of a daemon, trying to reach it would only delay the command line (and open a session)
+        daemon_known = (this._session is not None) or (this._running_server is not None)
+
+        if remote_path is not None:
+            if daemon_known:
+                try:
+                    return await this._rc_checksum(*remote_path, hash, remote)
+                except (ClientResponseError, ClientConnectorError, ServerTimeoutError):
+                    ...  # eg, the daemon is gone or doesn't provide operations/hashsum: the command line is used
+        elif os.path.isfile(path):
+            try:
+                hasher = hashlib.new(hash)
+            except ValueError:
+                ...  # eg, crc32 or quickxor: only rclone knows how to calculate them
+            else:
+                # Reading and hashing are blocking, hence they are kept away from the event loop
+                return await asyncio.to_thread(_hash_file, path, hasher)
+
+        return await this._cli_checksum(path, hash, remote)
+
+    async def _rc_checksum(this, root: str, name: str, hash: str, remote: bool) -> Union[str|None]:
+        '''
+        Calculate the checksum of a file via the rclone daemon, avoiding to launch a new rclone process
+
+        :param root: The directory containing the file
+        :param name: The file name
+        :param hash: The hash type
+        :param remote: TRUE to download the file if the remote doesn't support the hash type
+        :return: a string representing the hash of the file, None if the file was not found
+        '''
+
+        # hashsum works on directories: the filter restricts it to the file only. Hashing (and possibly downloading)
+        # a file takes as long as it takes, hence the default timeout doesn't apply
+        response = await this._request(_endpoint("operations", "hashsum"),
+                                       _LONG_REQUEST_TIMEOUT,
+                                       fs=root,
+                                       hashType=hash,
+                                       download=remote,
+                                       _filter={"IncludeRule": [f"/{_escape_glob(name)}"]})
+
+        for line in response.get('hashsum') or []:
+            checksum, _, filename = line.partition("  ")
+
+            if filename == name:
+                return checksum.strip()
+
+        return None
+
+    async def _cli_checksum(this, path: str, hash: str, remote: bool) -> Union[str|None]:
+        '''
+        Calculate the checksum of a file via the classic command line
+
+        :param path: Path to the file to get its checksum
+        :param hash: The hash type
+        :param remote: TRUE to download the file if the remote doesn't support the hash type
+        :return: a string representing the hash of the file, None if rclone failed
+        '''
+
         args = ["hashsum", hash, path]
 
         if remote:
             args.append("--download")
 
-
+        # stderr is never used: discarding it avoids buffering it (or blocking the process when the pipe is full)
         proc = await asyncio.create_subprocess_exec(this._cmd, *args,
                                                     stdout=asyncio.subprocess.PIPE,
-                                                    stderr=asyncio.subprocess.PIPE)
+                                                    stderr=asyncio.subprocess.DEVNULL)
 
-        stdout, stderr = await proc.communicate()
+        # The hash is the first token of the first line
+        line = await proc.stdout.readline()
+        await proc.communicate()  # drains any further output, so that the process can terminate
 
         if proc.returncode == 0:
-            return stdout.decode().split(" ")[0]
-
-
+            return line.split(b" ", 1)[0].decode()
 
+        return None
 
     async def copy_file(this, src_root, src_path, dst_root, dst_path) -> int:
         '''
@@ -224,16 +750,33 @@ class rclone:
             "srcRemote": src_path,
             "dstFs": dst_root,
             "dstRemote": dst_path,
-            "_async": "true"
+            "_async": True
         }
 
         response = await this.make_request("operations", "copyfile", **request_data)
+        this.invalidate(dst_root, dst_path)
 
         id = response['jobid']
-        this._transferring_jobs.append(id)
+        this._transferring_jobs.add(id)
+        this._pending_jobs.add(id)
+        this._job_destinations[id] = (dst_root, dst_path)  # cached entries are dropped again once the job terminates
 
         return id
 
+    async def copy_files(this, files: List[Tuple[str, str, str, str]]) -> List[Union[int | BaseException]]:
+        '''
+        Copy many files. Copy requests are sent concurrently, rather than one after the other
+
+        A failed request doesn't affect the others: the copies that were started are tracked (and keep running)
+        anyway, hence their job ids are returned together with the errors
+
+        :param files: A list of tuples (src_root, src_path, dst_root, dst_path), as for `copy_file`
+        :return: The list of job ids, in the same order of the provided files. Files whose copy could not be started
+                 are mapped to the exception raised while requesting it
+        '''
+
+        return list(await asyncio.gather(*[this.copy_file(*f) for f in files], return_exceptions=True))
+
     async def rmdir(this, root: str, path: str, *,  asynch = False) -> Self:
         '''
         Delete the provided directory (it must be empty)
@@ -244,11 +787,11 @@ class rclone:
         :return: This object
         '''
 
-        await this.make_request("operations",
-                                "rmdir",
-                                fs=root,
-                                remote=path,
-                                _async=asynch)
+        await this._request_no_body(_endpoint("operations", "rmdir"),
+                                    fs=root,
+                                    remote=path,
+                                    _async=asynch)
+        this.invalidate(root, path)
         return this
 
     async def delete_file(this, root: str, path: str, *,  asynch = False) -> Self:
@@ -261,31 +804,36 @@ class rclone:
         :return: This object
         '''
 
-        await this.make_request("operations",
-                                "deletefile",
-                                fs=root,
-                                remote=path,
-                                _async=asynch)
+        await this._request_no_body(_endpoint("operations", "deletefile"),
+                                    fs=root,
+                                    remote=path,
+                                    _async=asynch)
+        this.invalidate(root, path)
         return this
 
     @property
-    async def jobs(this) -> AsyncIterable[Tuple[int,RCJobStatus]]:
+    def jobs(this) -> AsyncIterable[Tuple[int,RCJobStatus]]:
+        '''
+        Same as `iter_jobs`, kept for backward compatibility
 
-        rclone_current_jobs = await this.get_rclone_job_ids()
+        :return: An asynchronous iterable of tuples (job id, status)
+        '''
+        return this.iter_jobs()
+
+    async def iter_jobs(this) -> AsyncIterable[Tuple[int,RCJobStatus]]:
+        '''
+        Poll the jobs launched by this object, and iterate over their status. The list of jobs is taken when the
+        iteration starts
 
-        for jobid in this._transferring_jobs:
+        :return: An asynchronous iterable of tuples (job id, status)
+        '''
 
-            if jobid in rclone_current_jobs:
-                this._transferring_jobs_last_update.setdefault(jobid,None)
+        tracked_jobs = sorted(this._transferring_jobs)  # job ids are increasing, hence this is the launch order
 
-                try:
-                    job_status = await this.get_job_status(jobid)
-                    this._transferring_jobs_last_update[jobid] = job_status
-                except (ClientResponseError,asyncio.TimeoutError):
-                    ...
-                    #job_status = this._transferring_jobs_last_update[jobid]
+        await this._collect_job_statuses(tracked_jobs)
 
-            job_status = this._transferring_jobs_last_update[jobid]
+        for jobid in tracked_jobs:
+            job_status = this._transferring_jobs_last_update.get(jobid)
 
             if job_status is not None:
                 status = job_status.status
@@ -294,16 +842,122 @@ class rclone:
 
             yield jobid,status
 
-    async def get_rclone_job_ids(this) -> List[int]:
-        request = await this.make_request("job","list")
+    async def _collect_job_statuses(this, jobids: List[int]) -> None:
+        '''
+        Poll concurrently the provided jobs, and store their status in the cache. Jobs that are already terminated, or
+        that rclone doesn't know about, are not polled. In case of connection issues, the last known status is kept
+
+        :param jobids: The job ids to poll
+        '''
+
+        # Terminated jobs can't change their status anymore: only the other ones are polled
+        live_jobs = [jobid for jobid in jobids if jobid in this._pending_jobs]
+
+        if len(live_jobs) > 0:
+            rclone_current_jobs = await this.get_rclone_job_ids()
+            live_jobs = [jobid for jobid in live_jobs if jobid in rclone_current_jobs]
+
+        if len(live_jobs) == 0:
+            return
+
+        # The stats of all the jobs are retrieved with a single request, while their status is polled concurrently
+        response_stats, *results = await asyncio.gather(this._request(_EP_CORE_STATS),
+                                                        *[this._request(_EP_JOB_STATUS, jobid=jobid)
+                                                          for jobid in live_jobs],
+                                                        return_exceptions=True)
+
+        if isinstance(response_stats, BaseException):
+            results = [response_stats] * len(live_jobs)
+        else:
+            transferring = dict()
+
+            for t in response_stats.get('transferring', []):
+                transferring.setdefault(t.get('group'), t)
+
+        for jobid, result in zip(live_jobs, results):
+            if isinstance(result, dict):
+                job = this._job_from_responses(jobid, result, transferring.get(f"job/{jobid}"))
+                this._record_job_status(jobid, job)
+            elif isinstance(result, (ClientResponseError,asyncio.TimeoutError)):
+                this._transferring_jobs_last_update.setdefault(jobid,None)  # the last known status is kept
+            else:
+                raise result
+
+    def _record_job_status(this, jobid: int, job_status: RCloneJob) -> None:
+        '''
+        Store the latest status of a job in the cache
+
+        :param jobid: The job id
+        :param job_status: The latest job status
+        '''
+
+        this._transferring_jobs_last_update[jobid] = job_status
+
+        if job_status.status in _TERMINAL:
+            this._pending_jobs.discard(jobid)
+
+            # Anything cached while the job was running (eg, the destination not existing yet) is stale now
+            destination = this._job_destinations.pop(jobid, None)
+
+            if destination is not None:
+                this.invalidate(*destination)
+
+    async def progress_stream(this) -> AsyncIterable[RCloneJob]:
+        '''
+        Poll the jobs launched by this object that are not terminated yet, yielding each job status as soon as it is
+        received (rather than waiting for all of them, as `jobs` does)
+
+        :return: An asynchronous iterable of RCloneJob objects
+        '''
+
+        rclone_current_jobs = await this.get_rclone_job_ids()
+
+        tasks = {asyncio.create_task(this.get_job_status(jobid)): jobid
+                 for jobid in this._transferring_jobs
+                 if (jobid in this._pending_jobs) and (jobid in rclone_current_jobs)}
+
+        try:
+            pending = set(tasks)
+
+            while len(pending) > 0:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    jobid = tasks[task]
+
+                    try:
+                        job_status = task.result()
+                    except (ClientResponseError, asyncio.TimeoutError):
+                        continue  # the last known status is kept
+
+                    this._record_job_status(jobid, job_status)
 
-        return [int(x) for x in request['jobids']]
+                    yield job_status
+        finally:
+            # If the caller stops iterating early, requests still in flight are no longer needed
+            for task in tasks:
+                task.cancel()
+
+    async def get_rclone_job_ids(this) -> set[int]:
+        request = await this._request(_EP_JOB_LIST)
+
+        return {int(x) for x in request['jobids']}
 
 
 
     async def has_finished(this) -> bool:
-        async for id,status in this.jobs:
-            if status not in [RCJobStatus.FINISHED, RCJobStatus.FAILED]:
+        '''
+        Check whether all the jobs launched by this object are either finished or failed. No request is made to rclone
+        when all the jobs were already known to be terminated (their status can no longer change)
+
+        :return: TRUE if all the jobs are terminated, FALSE otherwise
+        '''
+
+        if len(this._pending_jobs) == 0:
+            return True
+
+        async for id,status in this.iter_jobs():
+            if status not in _TERMINAL:
                 return False
 
         return True
@@ -318,17 +972,55 @@ class rclone:
         :param id: Job id to get the information from
         :return: An RCloneTransferJob object
         '''
-        response_status = await this.make_request("job", "status", jobid=id)
-        job = RCloneJob.from_json(response_status)
+        # The two requests are independent, hence they are sent concurrently
+        response_status, response_stats = await asyncio.gather(
+            this._request(_EP_JOB_STATUS, jobid=id),
+            this._request(_EP_CORE_STATS, group=f"job/{id}")
+        )
+
+        transferring = response_stats['transferring'][0] if 'transferring' in response_stats else None
+
+        return this._job_from_responses(id, response_status, transferring)
+
+    def _job_from_responses(this, id: int,
+                            response_status: Dict[str, Any],
+                            transferring: Union[Dict[str, Any] | None]) -> RCloneJob:
+        '''
+        Build the status of a job from the responses of rclone
+
+        :param id: Job id
+        :param response_status: The response of job/status
+        :param transferring: The core/stats entry of the file being transferred by the job, None if there is none
+        :return: An RCloneJob object
+        '''
 
-        response_stats = await this.make_request("core", "stats", group=f"job/{id}")
+        # Jobs already polled are updated in place, rather than allocating a new object at every poll
+        job = this._transferring_jobs_last_update.get(id)
 
-        if 'transferring' in response_stats.keys():
-            stats = RCloneJobStats.from_json(response_stats['transferring'][0])
-            job.stats = stats
+        if job is None:
+            job = RCloneJob.from_json(response_status)
+        else:
+            job.update_from_json(response_status)
+
+        job.stats = RCloneJobStats.from_json(transferring) if transferring is not None else None
 
         return job
 
+    async def get_transfer_details(this) -> RCloneTransferDetails:
+        '''
+        Get the transfer information of all the jobs launched by this object that are currently transferring a file.
+        Differently than calling `get_job_status` for each job, all the information is gathered with a single request
+
+        :return: An RCloneTransferDetails object
+        '''
+        response_stats = await this._request(_EP_CORE_STATS)
+
+        groups = {f"job/{id}" for id in this._transferring_jobs}
+
+        return RCloneTransferDetails([RCloneJobStats.from_json(t)
+                                      for t in response_stats.get('transferring', [])
+                                      if t.get('group') in groups])
+
 
     async def get_group_list(this) -> AsyncIterable[str]:
         response = await this.make_request("core","group-list")
@@ -342,8 +1034,14 @@ class rclone:
 
         return len(response) == 0
 
-    def get_last_status_update(this, jobid) -> Union[RCloneJobStats | None]:
-        return this._transferring_jobs_last_update[jobid] if jobid in this._transferring_jobs_last_update.keys() else None
+    def get_last_status_update(this, jobid: int) -> Union[RCloneJob | None]:
+        '''
+        Return the last known status of a job, without making any request to rclone
+
+        :param jobid: The job id
+        :return: An RCloneJob object, None if the job has never been polled successfully
+        '''
+        return this._transferring_jobs_last_update.get(jobid)
 
     #
     def clean_terminated_jobs(this) -> Self:
@@ -353,15 +1051,14 @@ class rclone:
         :return: This object
         '''
 
-        id_to_remove = []
-
-        for jobid,last_updates in this._transferring_jobs_last_update.items():
-            if last_updates.status in [RCJobStatus.FINISHED,RCJobStatus.FAILED]:
-                id_to_remove.append(jobid)
+        # jobs that have not been polled successfully yet have no status, and they are kept
+        terminated = {jobid for jobid,last_updates in this._transferring_jobs_last_update.items()
+                      if (last_updates is not None) and (last_updates.status in _TERMINAL)}
 
-        for jobid in id_to_remove:
-            del this._transferring_jobs_last_update[jobid]
-            this._transferring_jobs.remove(jobid)
+        this._transferring_jobs_last_update = {jobid: last_updates
+                                               for jobid,last_updates in this._transferring_jobs_last_update.items()
+                                               if jobid not in terminated}
+        this._transferring_jobs -= terminated
 
         return this
 
@@ -372,9 +1069,9 @@ class rclone:
 
         :return: TRUE if successful, FALSE otherwise
         '''
-        response = await this.make_request("job", "stop", jobid=jobid)
 
-        return len(response) == 0 # in case of success, rclone returns an empty json (weird, but it's what it is)
+        # in case of success, rclone returns an empty json (weird, but it's what it is): only the status code matters
+        return await this._request_no_body(_endpoint("job", "stop"), jobid=jobid)
 
     async def stop_pending_jobs(this) -> Self:
         '''
@@ -382,33 +1079,59 @@ class rclone:
 
         :return: This object
         '''
-        async for id,status in this.jobs:
-            if status in [RCJobStatus.NOT_STARTED, RCJobStatus.IN_PROGRESS]:
-                await this.stop_job(id)
+        # Jobs that are already known to be terminated don't need to be stopped (nor polled again)
+        ids = [jobid for jobid in this._transferring_jobs if jobid in this._pending_jobs]
+
+        # All the stop requests are sent at once
+        results = await asyncio.gather(*[this.stop_job(id) for id in ids], return_exceptions=True)
+
+        stopping = []
+
+        for id, result in zip(ids, results):
+            if isinstance(result, ClientResponseError):
+                continue  # eg, rclone has already forgotten about this job
+            elif isinstance(result, BaseException):
+                raise result
 
-                # sendign the command to stop a job doesn't mean it gets done immediately
-                # to avoid race conditions, better double check if it gets stopped for sure
-                finished = False
-                while not finished:
-                    stats = await this.get_job_status(id)
-                    finished = stats.finished
+            stopping.append(id)
 
+        # sendign the command to stop a job doesn't mean it gets done immediately
+        # to avoid race conditions, better double check if they get stopped for sure
+        await asyncio.gather(*[this._wait_finished(id) for id in stopping])
 
         return this
 
-    def run(this) -> Self:
+    async def _wait_finished(this, id: int) -> None:
         '''
-        Run the rclone remote control daemon
-        This method is intentionally blocking
+        Wait until a job is finished, polling its status with an exponential backoff
 
-        :return: The object itself
+        :param id: Job ID
+        '''
+
+        delay = 0.05
+
+        while not (job_status := await this.get_job_status(id)).finished:
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 1.0)
+
+        this._record_job_status(id, job_status)
+
+    def _daemon_command(this) -> List[str]:
+        '''
+        Build the command line to launch the rclone remote control daemon
+
+        :return: A list with the command and its arguments
         '''
 
+        if this._socket_path is not None:
+            rc_addr = f"unix://{this._socket_path}"
+        else:
+            rc_addr = f"{this._address}:{this._port}"
 
         cmd = [
             this._cmd,
             "rcd",
-            "--rc-addr", f"{this._address}:{this._port}",
+            "--rc-addr", rc_addr,
             "--log-level", "INFO",
             "--log-file", "rclone.log"
         ]
@@ -418,13 +1141,109 @@ class rclone:
         else:
             cmd += this._auth.cl_arguments
 
-        this._running_server = this._running_server = Popen(
-            cmd, stdin=PIPE, stdout=PIPE, stderr=PIPE
+        return cmd
+
+    def run(this) -> Self:
+        '''
+        Run the rclone remote control daemon
+        This method is intentionally blocking. Within a running event loop, `start` should be preferred
+
+        :return: The object itself
+        '''
+
+        # rclone logs to file: its standard streams are discarded, as pipes nobody reads would eventually fill up and
+        # block the daemon
+        this._running_server = Popen(
+            this._daemon_command(), stdin=DEVNULL, stdout=DEVNULL, stderr=DEVNULL
         )
 
         return this
 
+    async def start(this, timeout: float = 10.) -> Self:
+        '''
+        Run the rclone remote control daemon without blocking the event loop, and wait until it accepts requests
+
+        Raises a ChildProcessError if the daemon terminates before being ready
+        Raises a TimeoutError if the daemon is not ready within `timeout` seconds
+
+        :param timeout: Maximum number of seconds to wait for the daemon to be ready
+        :return: The object itself
+        '''
+
+        # rclone logs to file, hence its standard streams are not needed
+        this._running_server = await asyncio.create_subprocess_exec(*this._daemon_command(),
+                                                                    stdin=asyncio.subprocess.DEVNULL,
+                                                                    stdout=asyncio.subprocess.DEVNULL,
+                                                                    stderr=asyncio.subprocess.DEVNULL)
+
+        # Polls the daemon with an exponential backoff, so it is used as soon as it starts listening. Until then, a
+        # bare connection attempt is enough (and cheaper than a full HTTP request)
+        deadline = time.monotonic() + timeout
+        delay = 0.01
+
+        try:
+            while not ((await this._is_listening()) and (await this.is_ready())):
+                if this._running_server.returncode is not None:
+                    raise ChildProcessError("The rclone daemon terminated before being ready.")
+
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"The rclone daemon was not ready within {timeout} seconds.")
+
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 0.5)
+        except BaseException:
+            # Nobody would quit a daemon that failed to start (eg, `__aexit__` isn't called when `__aenter__` fails)
+            await this._abort_start()
+            raise
+
+        return this
+
+    async def _abort_start(this) -> None:
+        '''
+        Terminate the daemon launched by `start` and release the HTTP session, so nothing is left behind
+        '''
+
+        server = this._running_server
+        this._running_server = None
+
+        if server.returncode is None:
+            try:
+                server.kill()
+            except ProcessLookupError:
+                ...  # it has just terminated on its own
+
+        await server.wait()
+
+        if this._session is not None:
+            await this._session.close()
+            this._session = None
+
+    async def _is_listening(this) -> bool:
+        '''
+        Check whether the daemon accepts connections, without sending any request
+
+        :return: TRUE if a connection could be established, FALSE otherwise
+        '''
+
+        try:
+            if this._socket_path is not None:
+                _, writer = await asyncio.open_unix_connection(this._socket_path)
+            else:
+                _, writer = await asyncio.open_connection(this._address, this._port)
+        except OSError:
+            return False
+
+        writer.close()
+        await writer.wait_closed()
+
+        return True
+
     async def is_ready(this) -> bool:
+        '''
+        Check whether the daemon accepts requests
+
+        :return: TRUE if the daemon is ready, FALSE otherwise
+        '''
         try:
             await this.make_request("rc","noop")
             return True
@@ -445,11 +1264,15 @@ class rclone:
         if this._running_server is None:
             raise ChildProcessError("Unable to kill a process that was not run before.")
 
-        this._running_server.kill()
+        try:
+            this._running_server.kill()
+        except ProcessLookupError:
+            ...  # asyncio processes that already terminated can't be killed, which is what was wanted anyway
 
-        # The stdout of the process must be read in full after killing it, otherwise the process will turn in a
-        # zombie process (at least, in a POSIX environment).
-        this._running_server.communicate()
+        # The process must be waited for after killing it, otherwise it will turn in a zombie process (at least, in a
+        # POSIX environment). Processes launched via `start` are reaped by the event loop instead.
+        if isinstance(this._running_server, Popen):
+            this._running_server.wait()
 
         this._running_server = None
 
@@ -463,9 +1286,16 @@ class rclone:
 
         await this.make_request("core", "quit")
         await this._http_session.close()
+        this._session = None  # a new session (and connection pool) will be created if the object is used again
+
+        server = this._running_server
 
         try:
             this.kill()
-            return this
         except ChildProcessError:
             ...  # If the daemon was run externally, ie not from this object, it will raise an exception. Nothing to worry about
+
+        if isinstance(server, asyncio.subprocess.Process):
+            await server.wait()
+
+        return this